@@ -26,13 +26,25 @@ __metaclass__ = type
 #############################################
 
 
+from types import MappingProxyType
+
+
 class CommandArgs:  # pylint: disable=R0903
     """The arg spec for the ios_ping module."""
 
-    argument_spec = {
-        "commands": {"type": "list", "elements": "raw", "required": True},
-        "wait_for": {"type": "list", "elements": "str", "aliases": ["waitfor"]},
-        "match": {"default": "all", "choices": ["all", "any"]},
-        "retries": {"default": 9, "type": "int"},
-        "interval": {"default": 1, "type": "int"},
-    }  # pylint: disable=C0301
+    argument_spec = MappingProxyType(
+        {
+            "commands": {"type": "list", "elements": "raw", "required": True},
+            "wait_for": {"type": "list", "elements": "str", "aliases": ["waitfor"]},
+            "match": {"default": "all", "choices": ["all", "any"]},
+            "retries": {"default": 9, "type": "int"},
+            "interval": {"default": 1, "type": "int"},
+            "backoff": {"default": 1.0, "type": "float"},
+            "max_interval": {"type": "int"},
+            "return_format": {
+                "default": "both",
+                "choices": ["stdout", "stdout_lines", "both"],
+                "type": "str",
+            },
+        },
+    )  # pylint: disable=C0301
@@ -25,28 +25,47 @@ __metaclass__ = type
 #
 #############################################
 
+from types import MappingProxyType
+
 
 class ConfigArgs:  # pylint: disable=R0903
     """The arg spec for the ios_ping module."""
 
-    argument_spec = {
-        "src": {"type": "str"},
-        "lines": {"aliases": ["commands"], "type": "list", "elements": "str"},
-        "parents": {"type": "list", "elements": "str"},
-        "before": {"type": "list", "elements": "str"},
-        "after": {"type": "list", "elements": "str"},
-        "match": {"default": "line", "choices": ["line", "strict", "exact", "none"]},
-        "replace": {"default": "line", "choices": ["line", "block"]},
-        "multiline_delimiter": {"default": "@"},
-        "running_config": {"aliases": ["config"]},
-        "intended_config": {},
-        "defaults": {"type": "bool", "default": False},
-        "backup": {"type": "bool", "default": False},
-        "backup_options": {
-            "type": "dict",
-            "options": {"filename": {}, "dir_path": {"type": "path"}},
+    argument_spec = MappingProxyType(
+        {
+            "src": {"type": "str"},
+            "lines": {"aliases": ["commands"], "type": "list", "elements": "str"},
+            "parents": {"type": "list", "elements": "str"},
+            "sections": {
+                "type": "list",
+                "elements": "dict",
+                "options": {
+                    "lines": {"aliases": ["commands"], "type": "list", "elements": "str"},
+                    "parents": {"type": "list", "elements": "str"},
+                    "match": {"default": "line", "choices": ["line", "strict", "exact", "none"]},
+                    "replace": {"default": "line", "choices": ["line", "block"]},
+                },
+            },
+            "before": {"type": "list", "elements": "str"},
+            "after": {"type": "list", "elements": "str"},
+            "match": {"default": "line", "choices": ["line", "strict", "exact", "none"]},
+            "replace": {"default": "line", "choices": ["line", "block"]},
+            "multiline_delimiter": {"default": "@"},
+            "running_config": {"aliases": ["config"]},
+            "running_config_cache": {"type": "path"},
+            "running_config_cache_ttl": {"type": "int", "default": 60},
+            "intended_config": {},
+            "defaults": {"type": "bool", "default": False},
+            "backup": {"type": "bool", "default": False},
+            "backup_options": {
+                "type": "dict",
+                "options": {"filename": {}, "dir_path": {"type": "path"}},
+            },
+            "save_when": {
+                "choices": ["always", "never", "modified", "changed"],
+                "default": "never",
+            },
+            "diff_against": {"choices": ["startup", "intended", "running"]},
+            "diff_ignore_lines": {"type": "list", "elements": "str"},
         },
-        "save_when": {"choices": ["always", "never", "modified", "changed"], "default": "never"},
-        "diff_against": {"choices": ["startup", "intended", "running"]},
-        "diff_ignore_lines": {"type": "list", "elements": "str"},
-    }  # pylint: disable=C0301
+    )  # pylint: disable=C0301
@@ -27,22 +27,27 @@ The arg spec for the ioscm_ping module
 """
 
 
+from types import MappingProxyType
+
+
 class PingArgs:  # pylint: disable=R0903
     """The arg spec for the ios_ping module."""
 
-    argument_spec = {
-        "count": {"type": "int"},
-        "afi": {"choices": ["ip", "ipv6"], "default": "ip", "type": "str"},
-        "dest": {"required": True, "type": "str"},
-        "df_bit": {"default": False, "type": "bool"},
-        "source": {"type": "str"},
-        "ingress": {"type": "str"},
-        "egress": {"type": "str"},
-        "timeout": {"type": "int"},
-        "state": {
-            "choices": ["absent", "present"],
-            "default": "present",
-            "type": "str",
+    argument_spec = MappingProxyType(
+        {
+            "count": {"type": "int"},
+            "afi": {"choices": ["ip", "ipv6"], "default": "ip", "type": "str"},
+            "dest": {"required": True, "type": "str"},
+            "df_bit": {"default": False, "type": "bool"},
+            "source": {"type": "str"},
+            "ingress": {"type": "str"},
+            "egress": {"type": "str"},
+            "timeout": {"type": "int"},
+            "state": {
+                "choices": ["absent", "present"],
+                "default": "present",
+                "type": "str",
+            },
+            "vrf": {"type": "str"},
         },
-        "vrf": {"type": "str"},
-    }  # pylint: disable=C0301
+    )  # pylint: disable=C0301
@@ -18,14 +18,17 @@ created.
 """
 
 
+import random
+import re
 import time
 
+from collections import deque
+
 from ansible.module_utils._text import to_text
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.parsing import (
     Conditional,
 )
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.utils import (
-    to_lines,
     transform_commands,
 )
 from ansible_collections.community.ioscm.plugins.module_utils.network.ioscm.ioscm import (
@@ -33,12 +36,100 @@ from ansible_collections.community.ioscm.plugins.module_utils.network.ioscm.iosc
 )
 
 
+_CHECK_MODE_PREFIXES = ("show",)
+
+_RESULT_REF_RE = re.compile(r"\bresult\[(\d+)\]")
+
+
+def _to_lines(stdout):
+    """Split each response into lines.
+
+    Unlike ``split("\\n")`` this handles CRLF and lone CR endings in one
+    C-level pass and does not leave a trailing empty element on
+    newline-terminated output.
+
+    Args:
+        stdout (_type_): Responses from the device
+
+    Returns:
+        _type_: Yields back each response as a list of lines
+    """
+    for item in stdout:
+        yield item.splitlines() if isinstance(item, str) else item
+
+
+def _retry_delay(attempt, interval, backoff, max_interval, jitter=True):
+    """Compute the delay before the next retry.
+
+    Args:
+        attempt (_type_): Zero-based index of the attempt that just failed
+        interval (_type_): Base interval between retries
+        backoff (_type_): Multiplier applied to the interval per retry
+        max_interval (_type_): Optional upper bound for the delay
+        jitter (_type_): Whether to add random jitter to the delay
+
+    Returns:
+        _type_: Returns back the delay in seconds
+    """
+    delay = interval * (backoff**attempt)
+    if jitter and backoff > 1:
+        # jitter avoids synchronized polling across a fleet of hosts
+        delay += random.uniform(0, delay / 10)  # noqa: S311
+    if max_interval is not None:
+        delay = min(delay, max_interval)
+    return delay
+
+
+def _retry_budget(retries, interval, backoff, max_interval):
+    """Compute the nominal wall-clock budget of the retry schedule.
+
+    Args:
+        retries (_type_): Number of retries after the first attempt
+        interval (_type_): Base interval between retries
+        backoff (_type_): Multiplier applied to the interval per retry
+        max_interval (_type_): Optional upper bound for each delay
+
+    Returns:
+        _type_: Returns back the budget in seconds
+    """
+    return sum(
+        _retry_delay(attempt, interval, backoff, max_interval, jitter=False)
+        for attempt in range(retries)
+    )
+
+
+class CachedConditional(Conditional):
+    """Conditional that compiles its ``matches`` pattern only once.
+
+    The stock ``Conditional`` recompiles the pattern on every evaluation,
+    which adds up when a conditional is re-checked across many retries.
+    """
+
+    def __init__(self, conditional, encoding=None) -> None:
+        super().__init__(conditional, encoding=encoding)
+        found = _RESULT_REF_RE.findall(self.raw)
+        self.result_indices = frozenset(int(index) for index in found) if found else None
+        self._compiled = None
+        if getattr(self.func, "__name__", None) == "matches":
+            try:
+                self._compiled = re.compile(self.value, re.M)
+            except re.error:
+                # surface invalid patterns at evaluation time, as before
+                self._compiled = None
+
+    def matches(self, value):
+        if self._compiled is None:
+            self._compiled = re.compile(self.value, re.M)
+        return self._compiled.search(value) is not None
+
+
 class Command:
     """The ios_ping config class."""
 
     def __init__(self, module) -> None:
         self.module = module
         self.result = {}
+        self._transformed_commands = None
 
     def execute_module(self):
         """Execute the module.
@@ -58,27 +149,33 @@ class Command:
         Returns:
             _type_: Returns back command
         """
-        commands = transform_commands(module)
-        if module.check_mode:
-            for item in list(commands):
-                if not item["command"].startswith("show"):
-                    warnings.append(
-                        f"Only show commands are supported when using check mode, not executing { item.get('command') }",
-                    )
-                    commands.remove(item)
-        return commands
+        if self._transformed_commands is None:
+            self._transformed_commands = transform_commands(module)
+        commands = self._transformed_commands
+        if not module.check_mode:
+            return commands
+        supported = []
+        for item in commands:
+            if item["command"].startswith(_CHECK_MODE_PREFIXES):
+                supported.append(item)
+            else:
+                warnings.append(
+                    f"Only show commands are supported when using check mode, not executing { item.get('command') }",
+                )
+        return supported
 
     def generate_command(self):
         """Generate configuration commands to send based on
         want, have and desired state.
         """
+        params = self.module.params
         warnings, conditionals = [], []
         result = {"changed": False, "warnings": warnings}
         commands = self.parse_commands(self.module, warnings)
-        wait_for = self.module.params["wait_for"] or []
+        wait_for = params["wait_for"] or []
 
         try:
-            conditionals = [Conditional(c) for c in wait_for]
+            conditionals = [CachedConditional(c) for c in wait_for]
         except AttributeError as exc:
             self.module.fail_json(msg=to_text(exc))
 
@@ -89,7 +186,11 @@ class Command:
             msg = "One or more conditional statements have not been satisfied"
             self.module.fail_json(msg=msg, failed_conditions=failed_conditions)
 
-        result.update({"stdout": responses, "stdout_lines": list(to_lines(responses))})
+        return_format = params.get("return_format") or "both"
+        if return_format in ("stdout", "both"):
+            result["stdout"] = responses
+        if return_format in ("stdout_lines", "both"):
+            result["stdout_lines"] = list(_to_lines(responses))
         return result
 
     def run_commands(self, conditionals, commands):
@@ -102,17 +203,81 @@ class Command:
         Returns:
             _type_: conditionals exceptions and command responses
         """
-        retries = self.module.params.get("retries")
-        while retries >= 0:
-            responses = run_commands(self.module, commands)
-            for item in list(conditionals):
+        if not commands:
+            # check mode may have filtered out every command, so there is
+            # nothing to send and nothing to retry against
+            return conditionals, []
+        if not conditionals:
+            # nothing to wait for; dispatch once without retry bookkeeping
+            return conditionals, run_commands(self.module, commands)
+        conditionals = deque(conditionals)
+        # map each conditional to the result indices it references; None
+        # means the references could not be resolved to command positions
+        refs = {}
+        for item in conditionals:
+            indices = getattr(item, "result_indices", None)
+            if indices is None or any(index >= len(commands) for index in indices):
+                refs[item] = None
+            else:
+                refs[item] = indices
+        params = self.module.params
+        match = params.get("match")
+        interval = params.get("interval", 0)
+        backoff = params.get("backoff") or 1.0
+        max_interval = params.get("max_interval")
+        retries = params.get("retries")
+        deadline = None
+        if interval > 0 and (backoff > 1 or max_interval):
+            # when the backoff options are engaged, treat the summed delays
+            # as a wall-clock budget so slow device calls cannot stretch the
+            # task indefinitely; the default path keeps its historical
+            # attempt-count semantics
+            deadline = time.monotonic() + _retry_budget(retries, interval, backoff, max_interval)
+        for attempt in range(retries + 1):
+            resend = None
+            if attempt:
+                needed = set()
+                for item in conditionals:
+                    if refs[item] is None:
+                        needed = None
+                        break
+                    needed.update(refs[item])
+                if needed is not None:
+                    resend = sorted(needed)
+            if resend is None:
+                responses = run_commands(self.module, commands)
+            else:
+                # only re-run the commands an outstanding conditional still
+                # references; the cached output is reused for the rest
+                fresh = run_commands(self.module, [commands[index] for index in resend])
+                for pos, index in enumerate(resend):
+                    responses[index] = fresh[pos]
+            for _ in range(len(conditionals)):
+                item = conditionals.popleft()
                 if item(responses):
-                    if self.module.params.get("match") == "any":
-                        conditionals = []
+                    if match == "any":
+                        conditionals.clear()
                         break
-                    conditionals.remove(item)
+                elif match == "any" or attempt == retries:
+                    # keep cycling under match=any so every conditional gets
+                    # a chance; on the final attempt evaluate everything so
+                    # the reported failed conditionals are accurate
+                    conditionals.append(item)
+                else:
+                    # one miss already fails this attempt under match=all;
+                    # leave the failing conditional first for the next retry
+                    conditionals.appendleft(item)
+                    break
             if not conditionals:
                 break
-            time.sleep(self.module.params.get("interval", 0))
-            retries -= 1
+            if attempt < retries:
+                delay = _retry_delay(attempt, interval, backoff, max_interval)
+                if deadline is not None:
+                    remaining = deadline - time.monotonic()
+                    if remaining <= 0:
+                        break
+                    delay = min(delay, remaining)
+                # the sleep only separates attempts; never before the first
+                # evaluation nor after the last one
+                time.sleep(delay)
         return conditionals, responses
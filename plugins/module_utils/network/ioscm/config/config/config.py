@@ -18,13 +18,22 @@ created.
 """
 
 
+import contextlib
+import hashlib
 import json
+import os
+import re
+import tempfile
+import time
+
+from functools import lru_cache
 
 from ansible.module_utils._text import to_text
 from ansible.module_utils.connection import ConnectionError
 from ansible_collections.ansible.netcommon.plugins.module_utils.network.common.config import (
     NetworkConfig,
     dumps,
+    ignore_line,
 )
 from ansible_collections.community.ioscm.plugins.module_utils.network.ioscm.ioscm import (
     get_config,
@@ -34,12 +43,73 @@ from ansible_collections.community.ioscm.plugins.module_utils.network.ioscm.iosc
 )
 
 
+@lru_cache(maxsize=8)
+def _compile_ignore_lines(ignore_lines):
+    """Compile the ``diff_ignore_lines`` regexes once per process.
+
+    Args:
+        ignore_lines (_type_): Tuple of regexes for lines to exclude
+
+    Returns:
+        _type_: Returns back the compiled patterns
+    """
+    return tuple(re.compile(regex) for regex in ignore_lines)
+
+
+def _config_digest(contents, ignore_res=()):
+    """Digest a configuration for equality checks.
+
+    Blank lines, lines matching ``ignore_res`` and everything netcommon's
+    ``ignore_line`` drops (comment tokens plus banners such as ``Building
+    configuration`` and ``Using N out of M bytes``) are excluded, mirroring
+    what ``NetworkConfig`` skips when it computes its ``sha1``, but without
+    building the full indent tree.
+
+    Args:
+        contents (_type_): Raw configuration text
+        ignore_res (_type_): Compiled regexes for lines to exclude
+
+    Returns:
+        _type_: Returns back the digest of the filtered configuration
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for line in to_text(contents, errors="surrogate_or_strict").splitlines():
+        stripped = line.strip()
+        if not stripped or ignore_line(stripped):
+            continue
+        if any(regex.match(stripped) for regex in ignore_res):
+            continue
+        digest.update(line.rstrip().encode())
+        digest.update(b"\n")
+    return digest.digest()
+
+
 class Config:
     """The ios_ping config class."""
 
+    __slots__ = ("module", "result", "_nc_cache")
+
     def __init__(self, module) -> None:
         self.module = module
         self.result = {}
+        self._nc_cache = {}
+
+    def _network_config(self, contents, ignore_lines=None):
+        """Build or reuse a parsed ``NetworkConfig`` for the given contents.
+
+        Args:
+            contents (_type_): Raw configuration text
+            ignore_lines (_type_): Regexes for lines to exclude
+
+        Returns:
+            _type_: Returns back the parsed configuration
+        """
+        key = (contents, tuple(ignore_lines or ()))
+        cached = self._nc_cache.get(key)
+        if cached is None:
+            cached = NetworkConfig(indent=1, contents=contents, ignore_lines=ignore_lines)
+            self._nc_cache[key] = cached
+        return cached
 
     def execute_module(self):
         """Execute the module.
@@ -63,26 +133,86 @@ class Config:
         else:
             connection.edit_config(candidate=commands)
 
+    def build_candidate(self, lines, parents=None):
+        """Render a candidate configuration from lines and parents.
+
+        Args:
+            lines (_type_): The ordered set of configuration lines
+            parents (_type_): The parents identifying the section
+
+        Returns:
+            _type_: Returns back the candidate configuration text
+        """
+        candidate_obj = NetworkConfig(indent=1)
+        candidate_obj.add(lines, parents=parents or [])
+        return dumps(candidate_obj, "raw")
+
     def get_candidate_config(self, module):
         candidate = ""
         if module.params["src"]:
             candidate = module.params["src"]
         elif module.params["lines"]:
-            candidate_obj = NetworkConfig(indent=1)
-            parents = module.params["parents"] or []
-            candidate_obj.add(module.params["lines"], parents=parents)
-            candidate = dumps(candidate_obj, "raw")
+            candidate = self.build_candidate(module.params["lines"], module.params["parents"])
         return candidate
 
     def get_running_config(self, module, current_config=None, flags=None):
         running = module.params["running_config"]
         if not running:
-            if not module.params["defaults"] and current_config:
+            if current_config:
+                # current_config was fetched with the same flags (including
+                # the defaults flag when requested), so it can be reused
                 running = current_config
             else:
-                running = get_config(module, flags=flags)
+                running = self.fetch_running_config(module, flags)
+        return running
+
+    def fetch_running_config(self, module, flags=None):
+        """Fetch the running config, honoring the on-disk cache when enabled.
+
+        The cache only ever holds a copy fetched without extra flags, so it
+        is bypassed entirely when ``flags`` is non-empty (for example when
+        ``defaults`` is set); a cached copy taken without the defaults flag
+        must never stand in for one taken with it.
+
+        Args:
+            module (_type_): Contains module object
+            flags (_type_): Flags for the configuration fetch
+
+        Returns:
+            _type_: Returns back the running configuration
+        """
+        cache_path = module.params.get("running_config_cache") if not flags else None
+        if cache_path:
+            ttl = module.params.get("running_config_cache_ttl") or 0
+            try:
+                if time.time() - os.path.getmtime(cache_path) < ttl:
+                    with open(cache_path, encoding="utf-8") as cached:
+                        return cached.read()
+            except OSError:
+                pass
+        running = get_config(module, flags=flags)
+        if cache_path:
+            try:
+                directory = os.path.dirname(os.path.abspath(cache_path))
+                handle, tmp_path = tempfile.mkstemp(dir=directory)
+                with os.fdopen(handle, "w", encoding="utf-8") as tmp:
+                    tmp.write(running)
+                os.replace(tmp_path, cache_path)
+            except OSError as exc:
+                module.warn(f"unable to update running_config_cache { cache_path }: { exc }")
         return running
 
+    def invalidate_running_config_cache(self, module):
+        """Drop the on-disk cache once the device configuration has changed.
+
+        Args:
+            module (_type_): Contains module object
+        """
+        cache_path = module.params.get("running_config_cache")
+        if cache_path:
+            with contextlib.suppress(OSError):
+                os.remove(cache_path)
+
     def save_config(self, module, result):
         result["changed"] = True
         if not module.check_mode:
@@ -101,6 +231,7 @@ class Config:
         self.check_args(self.module, warnings)
         result["warnings"] = warnings
         diff_ignore_lines = self.module.params["diff_ignore_lines"]
+        ignore_res = _compile_ignore_lines(tuple(diff_ignore_lines or ()))
         config = None
         contents = None
         flags = get_defaults_flag(self.module) if self.module.params["defaults"] else []
@@ -111,34 +242,61 @@ class Config:
             and self.module.params["diff_against"] == "running"
         ):
             contents = get_config(self.module, flags=flags)
-            config = NetworkConfig(indent=1, contents=contents)
+            config = self._network_config(contents)
             if self.module.params["backup"]:
                 result["__backup__"] = contents
-        if any((self.module.params["lines"], self.module.params["src"])):
-            match = self.module.params["match"]
-            replace = self.module.params["replace"]
-            path = self.module.params["parents"]
-            candidate = self.get_candidate_config(self.module)
-            running = self.get_running_config(self.module, contents, flags=flags)
-            try:
-                response = connection.get_diff(
-                    candidate=candidate,
-                    running=running,
-                    diff_match=match,
-                    diff_ignore_lines=diff_ignore_lines,
-                    path=path,
-                    diff_replace=replace,
-                )
-            except ConnectionError as exc:
-                self.module.fail_json(msg=to_text(exc, errors="surrogate_then_replace"))
-            config_diff = response["config_diff"]
-            banner_diff = response["banner_diff"]
+        sections = self.module.params["sections"]
+        if sections or any((self.module.params["lines"], self.module.params["src"])):
+            if sections:
+                requests = [
+                    {
+                        "match": section["match"],
+                        "replace": section["replace"],
+                        "path": section["parents"],
+                        "candidate": self.build_candidate(
+                            section["lines"] or [],
+                            section["parents"],
+                        ),
+                    }
+                    for section in sections
+                ]
+            else:
+                requests = [
+                    {
+                        "match": self.module.params["match"],
+                        "replace": self.module.params["replace"],
+                        "path": self.module.params["parents"],
+                        "candidate": self.get_candidate_config(self.module),
+                    },
+                ]
+            if all(request["match"] == "none" for request in requests):
+                # get_diff does not consult the running config for match=none,
+                # so skip the device fetch it would otherwise trigger
+                running = self.module.params["running_config"] or ""
+            else:
+                running = self.get_running_config(self.module, contents, flags=flags)
+            diff_parts = []
+            banner_diff = {}
+            for request in requests:
+                try:
+                    response = connection.get_diff(
+                        candidate=request["candidate"],
+                        running=running,
+                        diff_match=request["match"],
+                        diff_ignore_lines=diff_ignore_lines,
+                        path=request["path"],
+                        diff_replace=request["replace"],
+                    )
+                except ConnectionError as exc:
+                    self.module.fail_json(msg=to_text(exc, errors="surrogate_then_replace"))
+                if response["config_diff"]:
+                    diff_parts.append(response["config_diff"])
+                banner_diff.update(response["banner_diff"] or {})
+            config_diff = "\n".join(diff_parts)
             if config_diff or banner_diff:
-                commands = config_diff.split("\n")
-                if self.module.params["before"]:
-                    commands[:0] = self.module.params["before"]
-                if self.module.params["after"]:
-                    commands.extend(self.module.params["after"])
+                before = self.module.params["before"] or ()
+                after = self.module.params["after"] or ()
+                commands = [*before, *config_diff.splitlines(), *after]
                 result["commands"] = commands
                 result["updates"] = commands
                 result["banners"] = banner_diff
@@ -153,24 +311,23 @@ class Config:
                             candidate=json.dumps(banner_diff),
                             multiline_delimiter=self.module.params["multiline_delimiter"],
                         )
+                    # the cached running config no longer reflects the device
+                    self.invalidate_running_config_cache(self.module)
                 result["changed"] = True
         running_config = self.module.params["running_config"]
         startup_config = None
         if self.module.params["save_when"] == "always":
             self.save_config(self.module, result)
-        elif self.module.params["save_when"] == "modified":
+        elif self.module.params["save_when"] == "modified" and (
+            result["changed"] or not running_config
+        ):
             output = run_commands(self.module, ["show running-config", "show startup-config"])
-            running_config = NetworkConfig(
-                indent=1,
-                contents=output[0],
-                ignore_lines=diff_ignore_lines,
-            )
-            startup_config = NetworkConfig(
-                indent=1,
-                contents=output[1],
-                ignore_lines=diff_ignore_lines,
-            )
-            if running_config.sha1 != startup_config.sha1:
+            running_config = output[0]
+            startup_config = output[1]
+            if _config_digest(running_config, ignore_res) != _config_digest(
+                startup_config,
+                ignore_res,
+            ):
                 self.save_config(self.module, result)
         elif self.module.params["save_when"] == "changed" and result["changed"]:
             self.save_config(self.module, result)
@@ -182,11 +339,8 @@ class Config:
                 contents = running_config
 
             # recreate the object in order to process diff_ignore_lines
-            running_config = NetworkConfig(
-                indent=1,
-                contents=contents,
-                ignore_lines=diff_ignore_lines,
-            )
+            running_config = self._network_config(contents, diff_ignore_lines)
+            base_config = None
             if self.module.params["diff_against"] == "running":
                 if self.module.check_mode:
                     self.module.warn(
@@ -195,20 +349,21 @@ class Config:
                     contents = None
                 else:
                     contents = config.config_text
+                    if not diff_ignore_lines:
+                        # the running config was already parsed above for the
+                        # backup/diff fetch; no need to re-parse its text
+                        base_config = config
             elif self.module.params["diff_against"] == "startup":
                 if not startup_config:
                     output = run_commands(self.module, "show startup-config")
                     contents = output[0]
                 else:
-                    contents = startup_config.config_text
+                    contents = startup_config
             elif self.module.params["diff_against"] == "intended":
                 contents = self.module.params["intended_config"]
             if contents is not None:
-                base_config = NetworkConfig(
-                    indent=1,
-                    contents=contents,
-                    ignore_lines=diff_ignore_lines,
-                )
+                if base_config is None:
+                    base_config = self._network_config(contents, diff_ignore_lines)
                 if running_config.sha1 != base_config.sha1:
                     before, after = "", ""
                     if self.module.params["diff_against"] == "intended":
@@ -224,7 +379,9 @@ class Config:
                         },
                     )
 
-        if result.get("changed") and any((self.module.params["src"], self.module.params["lines"])):
+        if result.get("changed") and any(
+            (self.module.params["src"], self.module.params["lines"], sections),
+        ):
             msg = (
                 "To ensure idempotency and correct diff the input configuration lines should be"
                 " similar to how they appear if present in"
@@ -232,9 +389,6 @@ class Config:
             )
             if self.module.params["src"]:
                 msg += " including the indentation"
-            if "warnings" in result:
-                result["warnings"].append(msg)
-            else:
-                result["warnings"] = msg
+            result.setdefault("warnings", []).append(msg)
 
         return result
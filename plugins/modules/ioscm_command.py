@@ -73,6 +73,9 @@ options:
     - Specifies the number of retries a command should by tried before it is considered
       failed. The command is run on the target device every retry and evaluated against
       the I(wait_for) conditions.
+    - When I(backoff) is greater than 1 or I(max_interval) is set, the summed retry
+      delays also act as a wall-clock budget and retrying stops once it is exhausted,
+      even if fewer than I(retries) attempts were made.
     default: 9
     type: int
   interval:
@@ -80,8 +83,37 @@ options:
     - Configures the interval in seconds to wait between retries of the command. If
       the command does not pass the specified conditions, the interval indicates how
       long to wait before trying the command again.
+    - When I(backoff) is greater than 1 or I(max_interval) is set, the interval seeds
+      a growing delay and the summed delays bound the total time spent retrying.
     default: 1
     type: int
+  backoff:
+    description:
+    - Multiplier applied to the interval after each retry. The default of C(1.0)
+      keeps the fixed polling cadence. Values greater than 1 grow the delay
+      exponentially, with a small random jitter, so fast-converging commands are
+      re-checked quickly while slow ones progressively back off from the device.
+    default: 1.0
+    type: float
+    version_added: 1.1.0
+  max_interval:
+    description:
+    - Upper bound in seconds for the delay between retries when I(backoff) is
+      greater than 1.
+    type: int
+    version_added: 1.1.0
+  return_format:
+    description:
+    - Controls which representations of the command output are returned. The default
+      C(both) returns C(stdout) and C(stdout_lines); selecting only one roughly halves
+      the result payload shipped back to the controller for large outputs.
+    default: both
+    type: str
+    choices:
+    - stdout
+    - stdout_lines
+    - both
+    version_added: 1.1.0
 """
 
 EXAMPLES = r"""
@@ -420,12 +452,14 @@ EXAMPLES = r"""
 RETURN = """
 stdout:
   description: The set of responses from the commands
-  returned: always apart from low level errors (such as action plugin)
+  returned: always apart from low level errors (such as action plugin), unless excluded
+    by I(return_format)
   type: list
   sample: ['...', '...']
 stdout_lines:
   description: The value of stdout split into a list
-  returned: always apart from low level errors (such as action plugin)
+  returned: always apart from low level errors (such as action plugin), unless excluded
+    by I(return_format)
   type: list
   sample: [['...', '...'], ['...'], ['...']]
 failed_conditions:
@@ -436,12 +470,6 @@ failed_conditions:
 """
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.community.ioscm.plugins.module_utils.network.ioscm.argspec.command.command import (
-    CommandArgs,
-)
-from ansible_collections.community.ioscm.plugins.module_utils.network.ioscm.config.command.command import (
-    Command,
-)
 
 
 def main():
@@ -450,8 +478,17 @@ def main():
 
     :returns: the result form module invocation
     """
+    # deferred so failing argument validation skips the heavier imports
+    from ansible_collections.community.ioscm.plugins.module_utils.network.ioscm.argspec.command.command import (
+        CommandArgs,
+    )
+
     module = AnsibleModule(argument_spec=CommandArgs.argument_spec)
 
+    from ansible_collections.community.ioscm.plugins.module_utils.network.ioscm.config.command.command import (
+        Command,
+    )
+
     result = Command(module).execute_module()
     module.exit_json(**result)
 
@@ -54,6 +54,52 @@ options:
       commands are checked against the set of top level or global commands.
     type: list
     elements: str
+  sections:
+    description:
+    - List of configuration sections to manage in a single module invocation. Each entry
+      supports its own I(lines), I(parents), I(match) and I(replace), mirroring the
+      corresponding top-level options. All sections are compared against a single fetch
+      of the running configuration and the resulting commands are pushed in one
+      configuration session, avoiding a connection round-trip per section when looping
+      with C(loop)/C(with_items).
+    - This argument is mutually exclusive with I(lines), I(parents) and I(src).
+    type: list
+    elements: dict
+    version_added: 1.1.0
+    suboptions:
+      lines:
+        description:
+        - The ordered set of commands for this section, as the top-level I(lines).
+        type: list
+        elements: str
+        aliases:
+        - commands
+      parents:
+        description:
+        - The ordered set of parents that uniquely identify this section, as the
+          top-level I(parents).
+        type: list
+        elements: str
+      match:
+        description:
+        - Instructs the module on the way to perform the matching for this section, as
+          the top-level I(match).
+        type: str
+        default: line
+        choices:
+        - line
+        - strict
+        - exact
+        - none
+      replace:
+        description:
+        - Instructs the module on the way to perform the configuration for this section,
+          as the top-level I(replace).
+        type: str
+        default: line
+        choices:
+        - line
+        - block
   src:
     description:
     - Specifies the source path to the file that contains the configuration or configuration
@@ -135,6 +181,26 @@ options:
     type: str
     aliases:
     - config
+  running_config_cache:
+    description:
+    - Path to a local file used to cache the running configuration between invocations.
+      When the file exists and is younger than I(running_config_cache_ttl), its contents
+      are used as the base configuration instead of fetching it from the device; after
+      a device fetch the cache file is refreshed atomically. Use a separate file per
+      host. The cache is only consulted when neither I(running_config) nor an already
+      fetched copy of the configuration is available, and it is bypassed entirely when
+      I(defaults) is set so a copy fetched without the defaults flag is never reused
+      in its place. The cache file is removed after this module changes the device
+      configuration, since it no longer reflects the device.
+    type: path
+    version_added: 1.1.0
+  running_config_cache_ttl:
+    description:
+    - Maximum age in seconds of I(running_config_cache) before it is considered stale
+      and the running configuration is fetched from the device again.
+    default: 60
+    type: int
+    version_added: 1.1.0
   defaults:
     description:
     - This argument specifies whether or not to collect all defaults when getting
@@ -360,29 +426,42 @@ time:
 """
 
 from ansible.module_utils.basic import AnsibleModule
-from ansible_collections.community.ioscm.plugins.module_utils.network.ioscm.argspec.config.config import (
-    ConfigArgs,
+
+
+_REQUIRED_IF = (
+    ("match", "strict", ("lines",)),
+    ("match", "exact", ("lines", "src"), True),
+    ("replace", "block", ("lines",)),
+    ("diff_against", "intended", ("intended_config",)),
 )
-from ansible_collections.community.ioscm.plugins.module_utils.network.ioscm.config.config.config import (
-    Config,
+
+_MUTUALLY_EXCLUSIVE = (
+    ("lines", "src"),
+    ("parents", "src"),
+    ("sections", "lines"),
+    ("sections", "src"),
+    ("sections", "parents"),
 )
 
 
 def main() -> None:
     """note: Main entry point for module execution."""
-    required_if = [
-        ("match", "strict", ["lines"]),
-        ("match", "exact", ["lines", "src"], True),
-        ("replace", "block", ["lines"]),
-        ("diff_against", "intended", ["intended_config"]),
-    ]
+    # deferred so failing argument validation skips the heavier imports
+    from ansible_collections.community.ioscm.plugins.module_utils.network.ioscm.argspec.config.config import (
+        ConfigArgs,
+    )
+
     module = AnsibleModule(
         argument_spec=ConfigArgs.argument_spec,
-        mutually_exclusive=[("lines", "src"), ("parents", "src")],
-        required_if=required_if,
+        mutually_exclusive=_MUTUALLY_EXCLUSIVE,
+        required_if=_REQUIRED_IF,
         supports_check_mode=True,
     )
 
+    from ansible_collections.community.ioscm.plugins.module_utils.network.ioscm.config.config.config import (
+        Config,
+    )
+
     result = Config(module).execute_module()
     module.exit_json(**result)
 